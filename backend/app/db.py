@@ -1,14 +1,43 @@
-from sqlmodel import SQLModel, create_engine, Session
+import asyncio
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 DATABASE_URL = "sqlite:///airports.db"
+ASYNC_DATABASE_URL = "sqlite+aiosqlite:///airports.db"
+
+# Keep connections open between requests instead of reconnecting each time
+POOL_SIZE = 20
+POOL_OPTIONS = dict(
+    pool_size=POOL_SIZE,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
 
+# Sync engine for scripts (seeding); the API uses async_engine
 engine = create_engine(
-    DATABASE_URL, connect_args={"check_same_thread": False}, echo=False
+    DATABASE_URL, connect_args={"check_same_thread": False}, echo=False, **POOL_OPTIONS
 )
 
-def init_db() -> None:
-    SQLModel.metadata.create_all(engine)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, echo=False, **POOL_OPTIONS)
+
+
+async def _ping() -> None:
+    async with async_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def init_db() -> None:
+    async with async_engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    # Open the pool's connections up front so first requests don't pay for them
+    await asyncio.gather(*(_ping() for _ in range(POOL_SIZE)))
+
 
-def get_session():
-    with Session(engine) as session:
+async def get_session():
+    async with AsyncSession(async_engine) as session:
         yield session
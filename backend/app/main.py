@@ -6,6 +6,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from .db import init_db
 from .routers import router
+from .utils.ext_airport import close_client, prime_airport_cache
 
 app = FastAPI(title="Vitamin D API")
 
@@ -21,5 +22,11 @@ app.include_router(router)
 
 
 @app.on_event("startup")
-def startup_event():
-    init_db()
+async def startup_event():
+    await init_db()
+    await prime_airport_cache()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await close_client()
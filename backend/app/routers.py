@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, Query
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from .models import Airport
 from .db import get_session
@@ -11,39 +12,41 @@ def health():
     return {"status": "ok"}
 
 from .utils.ext_airport import get_or_create_airport
-from .utils.sun import subsolar_point
+from .utils.sun import subsolar_point_cached, utc_minute
 from .utils.seat_scoring import SeatScorer
 from datetime import datetime
+import asyncio
 
 @router.get("/airports")
-def list_airports(q: str = Query(min_length=1), session: Session = Depends(get_session)):
-    stmt = select(Airport).where(Airport.iata.ilike(f"%{q.upper()}%"))[:5]
-    results = session.exec(stmt).all()
-    if not results and len(q) == 3:
-        # try fetch external
-        ap = get_or_create_airport(q)
-        if ap:
-            results = [ap]
-    return results
+async def list_airports(q: str = Query(min_length=1), session: AsyncSession = Depends(get_session)):
+    qu = q.upper()
+    if len(qu) == 3:
+        # exact IATA code: in-memory cache, then primary key, then AeroDataBox
+        ap = await get_or_create_airport(qu)
+        return [ap] if ap else []
+    # IATA codes are stored upper-case, so a range on the primary key finds prefixes via its index
+    stmt = select(Airport).where(Airport.iata >= qu, Airport.iata < qu + "\x7f").limit(5)
+    return (await session.exec(stmt)).all()
 
 @router.get("/airport/{iata}")
-def airport_details(iata: str):
-    ap = get_or_create_airport(iata.upper())
+async def airport_details(iata: str):
+    ap = await get_or_create_airport(iata.upper())
     if not ap:
         return {"error": "not found"}
     return ap
 
 @router.get("/subsolar")
-def subsolar(date: str, time: str):
+async def subsolar(date: str, time: str):
     """Return sub-solar lat/lon for given date (YYYY-MM-DD) and time (HH:MM, utc)."""
     try:
         dt = datetime.fromisoformat(f"{date}T{time}:00+00:00")
     except ValueError:
         return {"error": "invalid datetime"}
-    return subsolar_point(dt)
+    lat, lon = subsolar_point_cached(utc_minute(dt))
+    return {"lat": lat, "lon": lon}
 
 @router.get("/seat-recommendation")
-def seat_recommendation(
+async def seat_recommendation(
     from_iata: str,
     to_iata: str,
     date: str,
@@ -54,8 +57,8 @@ def seat_recommendation(
     """Calculate optimal seat recommendation based on sun position during flight."""
     try:
         # Get airport coordinates
-        from_airport = get_or_create_airport(from_iata)
-        to_airport = get_or_create_airport(to_iata)
+        from_airport = await get_or_create_airport(from_iata)
+        to_airport = await get_or_create_airport(to_iata)
         
         if not from_airport or not to_airport:
             return {"error": "Airport not found"}
@@ -71,8 +74,9 @@ def seat_recommendation(
         # Initialize seat scorer
         scorer = SeatScorer()
         
-        # Calculate seat scores
-        scores = scorer.calculate_seat_scores(
+        # Calculate seat scores off the event loop (CPU-bound)
+        scores = await asyncio.to_thread(
+            scorer.calculate_seat_scores,
             from_lat=from_airport.lat,
             from_lon=from_airport.lon,
             to_lat=to_airport.lat,
@@ -1,54 +1,75 @@
+import logging
 import os
-import requests
-from sqlmodel import Session
+import httpx
+from cachetools import TTLCache
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from ..models import Airport
-from ..db import engine
+from ..db import async_engine
+
+logger = logging.getLogger(__name__)
 
 API_HOST = "https://prod.api.market/api/v1/aedbx/aerodatabox"
 
+# Shared client so lookups reuse pooled HTTP/2 connections instead of a new handshake each time
+_client = httpx.AsyncClient(http2=True, timeout=5.0)
+
+
+# Airports keyed by IATA code so hot lookups skip the database entirely
+_airport_cache: TTLCache = TTLCache(maxsize=10_000, ttl=86400)
+
+
+async def close_client() -> None:
+    await _client.aclose()
+
+
+async def prime_airport_cache() -> None:
+    """Load every stored airport into the in-memory cache."""
+    async with AsyncSession(async_engine) as session:
+        for airport in (await session.exec(select(Airport))).all():
+            _airport_cache[airport.iata] = airport
+
 
-def get_or_create_airport(iata: str) -> Airport | None:
+async def get_or_create_airport(iata: str) -> Airport | None:
     code = iata.upper()
-    print(code)
-    with Session(engine) as session:
-        obj = session.get(Airport, code)
+    logger.debug("Looking up airport %s", code)
+    cached = _airport_cache.get(code)
+    if cached:
+        return cached
+    async with AsyncSession(async_engine) as session:
+        obj = await session.get(Airport, code)
         if obj:
+            _airport_cache[code] = obj
             return obj
-    print("no obj found")
+    logger.debug("Airport %s not stored, fetching from AeroDataBox", code)
     key = os.getenv("AERODATA_API_KEY")
     if not key:
-        print("AERODATA_API_KEY not set")
+        logger.warning("AERODATA_API_KEY not set")
         return None
     url = f"{API_HOST}/airports/iata/{code}"
-    print(url)
-    resp = requests.get(url, headers={
+    logger.debug("GET %s", url)
+    resp = await _client.get(url, headers={
         "x-api-market-key": key
-    }, timeout=5000)
-    print("Res",resp.text)
-    if not resp.ok:
-        print("AeroDataBox error", resp.status_code)
+    })
+    if not resp.is_success:
+        logger.warning("AeroDataBox error %s for %s", resp.status_code, code)
         return None
     
     # Check if response has content
     if not resp.content:
-        print(f"AeroDataBox returned empty response for {code}")
+        logger.warning("AeroDataBox returned empty response for %s", code)
         return None
     
     try:
         j = resp.json()
-        print(f"API Response for {code}: {j}")
     except Exception as e:
-        print(f"Failed to parse JSON response for {code}: {e}")
-        print(f"Response content: {resp.text}")
+        logger.warning("Failed to parse JSON response for %s: %s (content: %s)", code, e, resp.text)
         return None
     
     # Validate that we have the required data
-    print(f"Validating coordinates for {code}")
     if not j.get("location", {}).get("lat") or not j.get("location", {}).get("lon"):
-        print(f"Missing coordinates for airport {code}")
-        print(f"Location data: {j.get('location')}")
+        logger.warning("Missing coordinates for airport %s: %s", code, j.get("location"))
         return None
-    print(f"Coordinates validated for {code}")
     
     airport = Airport(
         iata=code,
@@ -61,20 +82,22 @@ def get_or_create_airport(iata: str) -> Airport | None:
     )
     
     # Use a single session for the entire operation
-    with Session(engine) as session:
+    async with AsyncSession(async_engine) as session:
         try:
             session.add(airport)
-            session.commit()
-            session.refresh(airport)  # Refresh to get the committed object
-            print(f"Successfully added airport: {airport}")
+            await session.commit()
+            await session.refresh(airport)  # Refresh to get the committed object
+            logger.debug("Added airport %s", airport)
+            _airport_cache[code] = airport
             return airport
         except Exception as e:
-            print(f"Error inserting airport {code}: {e}")
-            session.rollback()
+            logger.warning("Error inserting airport %s: %s", code, e)
+            await session.rollback()
             # Try to get existing airport
-            existing = session.get(Airport, code)
+            existing = await session.get(Airport, code)
             if existing:
-                print(f"Found existing airport: {existing}")
+                logger.debug("Found existing airport %s", existing)
+                _airport_cache[code] = existing
                 return existing
-            print(f"Failed to insert or find airport {code}")
+            logger.warning("Failed to insert or find airport %s", code)
             return None
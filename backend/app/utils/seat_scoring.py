@@ -1,12 +1,70 @@
+import logging
 import math
-from datetime import datetime, timedelta
+import numpy as np
+from datetime import datetime
 from typing import Dict, Tuple, Optional
-from ..utils.sun import subsolar_point
+from numba import njit
+from ..utils.sun import subsolar_point_cached, subsolar_points, utc_minute
+
+logger = logging.getLogger(__name__)
+
+# |sin| of each whole degree 0-180, for sun weights
+_SIN_LUT = np.abs(np.sin(np.deg2rad(np.arange(181))))
+
+
+@njit(cache=True)
+def _bearing_rad(lon1, lon2, sin_lat1, cos_lat1, sin_lat2, cos_lat2):
+    """Bearing in degrees (0-360) from point 1 to point 2; longitudes in radians, latitudes as sin/cos."""
+    d_lon = lon2 - lon1
+    y = math.sin(d_lon) * cos_lat2
+    x = cos_lat1 * sin_lat2 - sin_lat1 * cos_lat2 * math.cos(d_lon)
+    return math.degrees(math.atan2(y, x)) % 360
+
+
+# Compiled eagerly for the one signature calculate_seat_scores passes, so no
+# request can trigger a fresh specialization
+@njit("Tuple((float64[::1], boolean[::1]))(float64[::1], float64[::1], float64[::1], float64[::1], "
+      "float64, float64, boolean[::1])", cache=True)
+def _score_kernel(plane_lat_r, plane_lon_r, sun_lat_r, sun_lon_r, dest_lat_r, dest_lon_r, is_sunrise):
+    """
+    Accumulate sun weights per seat side over all flight samples.
+
+    All coordinates are in radians, converted once by the caller.
+    Returns ([left_sunrise, left_sunset, right_sunrise, right_sunset],
+    mask of samples with the sun above the horizon). is_sunrise flags
+    samples in the sunrise window. Mirrors SeatScorer._calculate_sun_altitude
+    and _calculate_bearing.
+    """
+    n = plane_lat_r.shape[0]
+    scores = np.zeros(4)
+    above = np.empty(n, dtype=np.bool_)
+    # Destination terms are loop-invariant
+    sin_dest_lat = math.sin(dest_lat_r)
+    cos_dest_lat = math.cos(dest_lat_r)
+    for i in range(n):
+        # Sun's altitude at plane position
+        altitude = 90.0 - math.degrees(abs(sun_lat_r[i] - plane_lat_r[i]) + abs(sun_lon_r[i] - plane_lon_r[i])) / 2.0
+        above[i] = altitude > 0.0
+        
+        sin_plane_lat = math.sin(plane_lat_r[i])
+        cos_plane_lat = math.cos(plane_lat_r[i])
+        
+        # Bearings from plane to destination and to sun
+        bearing_to_dest = _bearing_rad(plane_lon_r[i], dest_lon_r,
+                                       sin_plane_lat, cos_plane_lat, sin_dest_lat, cos_dest_lat)
+        bearing_to_sun = _bearing_rad(plane_lon_r[i], sun_lon_r[i],
+                                      sin_plane_lat, cos_plane_lat,
+                                      math.sin(sun_lat_r[i]), math.cos(sun_lat_r[i]))
+        
+        angle_diff = ((bearing_to_sun - bearing_to_dest + 540) % 360) - 180
+        
+        # Branchless: pick the bucket from the masks, weight is zero below the horizon
+        slot = 2 * (angle_diff > 0.0) + 1 - is_sunrise[i]
+        scores[slot] += (altitude / 90.0) * above[i]
+    return scores, above
+
 
 class SeatScorer:
-    def __init__(self):
-        self.sun_cache = {}  # Cache for sun position calculations
-    
     def calculate_seat_scores(self, 
                              from_lat: float, from_lon: float,
                              to_lat: float, to_lon: float,
@@ -33,81 +91,30 @@ class SeatScorer:
         # Determine time intervals based on flight duration
         interval_minutes = 1  # Sample every minute for accuracy
         
-        # Track sunrise/sunset events
-        sunrise_event = None
-        sunset_event = None
+        # Evaluate every interval at once over the whole time vector
+        minutes = np.arange(0, duration_minutes + 1, interval_minutes)
+        times = np.datetime64(departure_dt, "m") + minutes.astype("timedelta64[m]")
         
-        # Process each interval
-        for minute in range(0, duration_minutes + 1, interval_minutes):
-            # Calculate current time
-            current_time = departure_dt + timedelta(minutes=minute)
-            
-            # Calculate plane position along flight path
-            progress = minute / duration_minutes if duration_minutes > 0 else 0
-            plane_lat = from_lat + (to_lat - from_lat) * progress
-            plane_lon = from_lon + (to_lon - from_lon) * progress
-            
-            # Get sun position
-            sun_pos = self._get_cached_sun_position(current_time)
-            
-            # Calculate sun's altitude at plane position
-            sun_altitude = self._calculate_sun_altitude((plane_lat, plane_lon), sun_pos)
-            
-            # Only process if sun is above horizon
-            if sun_altitude > 0:
-                # Calculate bearing from plane to destination
-                bearing_to_dest = self._calculate_bearing(plane_lat, plane_lon, to_lat, to_lon)
-                
-                # Calculate bearing from plane to sun
-                bearing_to_sun = self._calculate_bearing(plane_lat, plane_lon, sun_pos["lat"], sun_pos["lon"])
-                
-                # Calculate angle difference to determine which side sun is on
-                angle_diff = ((bearing_to_sun - bearing_to_dest + 540) % 360) - 180
-                
-                # Determine which side the sun is on
-                sun_on_right = angle_diff > 0
-                
-                # Calculate sun weight based on altitude (higher altitude = more weight)
-                sun_weight = sun_altitude / 90.0  # Normalize to 0-1
-                
-                # Determine if it's sunrise or sunset time
-                is_sunrise = self._is_sun_rising(current_time)
-                
-                # Debug information
-                # print(f"Minute: {minute}, Progress: {progress:.2f}, Plane: ({plane_lat:.3f}, {plane_lon:.3f})")
-                # print(f"  Bearing to dest: {bearing_to_dest:.1f}°, Bearing to sun: {bearing_to_sun:.1f}°")
-                # print(f"  Angle diff: {angle_diff:.1f}°, Sun on right: {sun_on_right}")
-                # print(f"  Sun altitude: {sun_altitude:.1f}°, Weight: {sun_weight:.3f}")
-                
-                # Assign points based on sun position
-                if sun_on_right:
-                    # Sun is on right side
-                    if is_sunrise:
-                        right_side["sunrise"] += sun_weight
-                        # print(f"  -> Right side sunrise +{sun_weight:.3f}")
-                    else:
-                        right_side["sunset"] += sun_weight
-                        # print(f"  -> Right side sunset +{sun_weight:.3f}")
-                else:
-                    # Sun is on left side
-                    if is_sunrise:
-                        left_side["sunrise"] += sun_weight
-                        # print(f"  -> Left side sunrise +{sun_weight:.3f}")
-                    else:
-                        left_side["sunset"] += sun_weight
-                        # print(f"  -> Left side sunset +{sun_weight:.3f}")
-                
-                # Track sunrise/sunset events
-                if is_sunrise and sunrise_event is None:
-                    sunrise_event = {
-                        "time": current_time,
-                        "location": {"lat": plane_lat, "lon": plane_lon}
-                    }
-                elif not is_sunrise and sunset_event is None:
-                    sunset_event = {
-                        "time": current_time,
-                        "location": {"lat": plane_lat, "lon": plane_lon}
-                    }
+        # Calculate plane positions along the great-circle flight path
+        progress = minutes / duration_minutes if duration_minutes > 0 else np.zeros(len(minutes))
+        plane_lat, plane_lon = self._interpolate_great_circle(from_lat, from_lon, to_lat, to_lon, progress)
+        
+        # Get sun positions for the whole flight in one batch
+        sun_lat, sun_lon = subsolar_points(times)
+        
+        # Hour of day for each sample, used to split sunrise/sunset
+        dep_minute_of_day = departure_dt.hour * 60 + departure_dt.minute
+        hours = ((dep_minute_of_day + minutes) // 60) % 24
+        is_sunrise = (hours >= 5) & (hours <= 12)  # Same window as _is_sun_rising
+        
+        # Score every sample in a single compiled pass
+        scores, above = _score_kernel(
+            np.radians(plane_lat), np.radians(plane_lon),
+            np.radians(sun_lat), np.radians(sun_lon),
+            math.radians(to_lat), math.radians(to_lon), is_sunrise
+        )
+        left_side["sunrise"], left_side["sunset"] = float(scores[0]), float(scores[1])
+        right_side["sunrise"], right_side["sunset"] = float(scores[2]), float(scores[3])
         
         # Calculate total scores
         left_total = left_side["sunrise"] + left_side["sunset"]
@@ -143,17 +150,20 @@ class SeatScorer:
             # No preference, use total score comparison
             recommended_side = "left" if left_total > right_total else "right"
         
-        # Print scores to console for debugging
-        print(f"=== SEAT SCORING DEBUG ===")
-        print(f"Preference: {preference}")
-        print(f"Left Side - Sunrise: {left_side['sunrise']:.2f}, Sunset: {left_side['sunset']:.2f}, Total: {left_total:.2f}")
-        print(f"Right Side - Sunrise: {right_side['sunrise']:.2f}, Sunset: {right_side['sunset']:.2f}, Total: {right_total:.2f}")
-        print(f"Recommended Side: {recommended_side}")
-        if sunrise_event:
-            print(f"Sunrise Event: {sunrise_event['time']} at ({sunrise_event['location']['lat']:.3f}, {sunrise_event['location']['lon']:.3f})")
-        if sunset_event:
-            print(f"Sunset Event: {sunset_event['time']} at ({sunset_event['location']['lat']:.3f}, {sunset_event['location']['lon']:.3f})")
-        print(f"==========================")
+        if logger.isEnabledFor(logging.DEBUG):
+            # Track sunrise/sunset events
+            sunrise_event = self._first_event(above & is_sunrise, times, plane_lat, plane_lon)
+            sunset_event = self._first_event(above & ~is_sunrise, times, plane_lat, plane_lon)
+            logger.debug("Seat scores (preference=%s): left sunrise=%.2f sunset=%.2f total=%.2f, "
+                         "right sunrise=%.2f sunset=%.2f total=%.2f, recommended=%s",
+                         preference, left_side["sunrise"], left_side["sunset"], left_total,
+                         right_side["sunrise"], right_side["sunset"], right_total, recommended_side)
+            if sunrise_event:
+                logger.debug("Sunrise event: %s at (%.3f, %.3f)", sunrise_event["time"],
+                             sunrise_event["location"]["lat"], sunrise_event["location"]["lon"])
+            if sunset_event:
+                logger.debug("Sunset event: %s at (%.3f, %.3f)", sunset_event["time"],
+                             sunset_event["location"]["lat"], sunset_event["location"]["lon"])
         
         return {
             "left_side": left_side,
@@ -167,15 +177,34 @@ class SeatScorer:
     def _calculate_flight_path(self, from_lat: float, from_lon: float, 
                               to_lat: float, to_lon: float, duration_minutes: int) -> list:
         """Calculate great circle flight path with multiple points."""
-        # Simple linear interpolation for now
-        # In production, use proper great circle calculation
-        points = []
-        for i in range(0, duration_minutes + 1):
-            progress = i / duration_minutes
-            lat = from_lat + (to_lat - from_lat) * progress
-            lon = from_lon + (to_lon - from_lon) * progress
-            points.append((lat, lon))
-        return points
+        progress = np.arange(0, duration_minutes + 1) / duration_minutes
+        lats, lons = self._interpolate_great_circle(from_lat, from_lon, to_lat, to_lon, progress)
+        return list(zip(lats.tolist(), lons.tolist()))
+    
+    def _interpolate_great_circle(self, from_lat: float, from_lon: float, to_lat: float, to_lon: float,
+                                  progress: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Spherical linear interpolation (slerp) between two points for progress values in [0, 1]."""
+        lat1, lon1, lat2, lon2 = map(math.radians, [from_lat, from_lon, to_lat, to_lon])
+        
+        # Unit vectors of both endpoints
+        u = np.array([math.cos(lat1) * math.cos(lon1), math.cos(lat1) * math.sin(lon1), math.sin(lat1)])
+        v = np.array([math.cos(lat2) * math.cos(lon2), math.cos(lat2) * math.sin(lon2), math.sin(lat2)])
+        
+        # Central angle between endpoints
+        omega = math.acos(min(1.0, max(-1.0, float(np.dot(u, v)))))
+        if omega < 1e-9:
+            # Coincident points: the plane never moves
+            return np.full(len(progress), float(from_lat)), np.full(len(progress), float(from_lon))
+        if math.pi - omega < 1e-9:
+            # Antipodal points: every great circle through them is equally short
+            raise ValueError("Great-circle path is undefined between antipodal points")
+        
+        t = np.asarray(progress)[:, None]
+        p = (np.sin((1 - t) * omega) * u + np.sin(t * omega) * v) / math.sin(omega)
+        
+        lat = np.degrees(np.arctan2(p[:, 2], np.hypot(p[:, 0], p[:, 1])))
+        lon = np.degrees(np.arctan2(p[:, 1], p[:, 0]))
+        return lat, lon
     
     def _get_plane_position(self, flight_points: list, minute: int, duration_minutes: int) -> Tuple[float, float]:
         """Get plane position at specific minute."""
@@ -185,27 +214,34 @@ class SeatScorer:
     
     def _get_cached_sun_position(self, dt: datetime) -> Dict[str, float]:
         """Get sun position with caching."""
-        cache_key = dt.strftime("%Y-%m-%d %H:%M")
-        
-        if cache_key not in self.sun_cache:
-            self.sun_cache[cache_key] = subsolar_point(dt)
-        
-        return self.sun_cache[cache_key]
+        lat, lon = subsolar_point_cached(utc_minute(dt))
+        return {"lat": lat, "lon": lon}
+    
+    def _first_event(self, mask: np.ndarray, times: np.ndarray, plane_lat: np.ndarray, plane_lon: np.ndarray) -> Optional[Dict]:
+        """Return time and plane location of the first sample matching mask."""
+        hits = np.flatnonzero(mask)
+        if len(hits) == 0:
+            return None
+        i = hits[0]
+        return {
+            "time": times[i].astype(datetime),
+            "location": {"lat": float(plane_lat[i]), "lon": float(plane_lon[i])}
+        }
     
     def _calculate_sun_altitude(self, plane_pos: Tuple[float, float], sun_pos: Dict[str, float]) -> float:
-        """Calculate sun's altitude at plane position."""
+        """Calculate sun's altitude at plane position. Accepts scalars or NumPy arrays."""
         # Simplified calculation - in production, use proper astronomical formulas
         plane_lat, plane_lon = plane_pos
         sun_lat, sun_lon = sun_pos["lat"], sun_pos["lon"]
         
         # Calculate angular distance
-        lat_diff = abs(sun_lat - plane_lat)
-        lon_diff = abs(sun_lon - plane_lon)
+        lat_diff = np.abs(sun_lat - plane_lat)
+        lon_diff = np.abs(sun_lon - plane_lon)
         
         # Simplified altitude calculation
         # In reality, this should use proper astronomical formulas
         altitude = 90 - (lat_diff + lon_diff) / 2
-        return max(0, altitude)  # Ensure non-negative
+        return np.maximum(0, altitude)  # Ensure non-negative
     
     def _calculate_plane_bearing(self, flight_points: list, minute: int, duration_minutes: int) -> float:
         """Calculate plane's bearing at specific minute."""
@@ -219,13 +255,7 @@ class SeatScorer:
         # Calculate bearing
         lat1, lon1 = current
         lat2, lon2 = next_point
-        
-        d_lon = lon2 - lon1
-        y = math.sin(d_lon) * math.cos(lat2)
-        x = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(d_lon)
-        bearing = math.atan2(y, x)
-        
-        return math.degrees(bearing) % 360
+        return self._calculate_bearing(lat1, lon1, lat2, lon2)
     
     def _calculate_sun_azimuth(self, plane_pos: Tuple[float, float], sun_pos: Dict[str, float]) -> float:
         """Calculate sun's azimuth relative to plane position."""
@@ -233,12 +263,7 @@ class SeatScorer:
         sun_lat, sun_lon = sun_pos["lat"], sun_pos["lon"]
         
         # Calculate azimuth from plane to sun
-        d_lon = sun_lon - plane_lon
-        y = math.sin(d_lon) * math.cos(sun_lat)
-        x = math.cos(plane_lat) * math.sin(sun_lat) - math.sin(plane_lat) * math.cos(sun_lat) * math.cos(d_lon)
-        azimuth = math.atan2(y, x)
-        
-        return math.degrees(azimuth) % 360
+        return self._calculate_bearing(plane_lat, plane_lon, sun_lat, sun_lon)
     
     def _calculate_sun_weight(self, sun_relative_angle: float) -> float:
         """
@@ -253,18 +278,17 @@ class SeatScorer:
         # Normalize angle to 0-180 range
         angle = abs(sun_relative_angle % 180)
         
-        # Convert to weight: 0° = 0.0, 90° = 1.0, 180° = 0.0
-        weight = abs(math.sin(math.radians(angle)))
-        
-        return weight
+        # Convert to weight: 0° = 0.0, 90° = 1.0, 180° = 0.0 (whole-degree lookup)
+        return float(_SIN_LUT[int(angle)])
     
     def _calculate_bearing(self, from_lat: float, from_lon: float, to_lat: float, to_lon: float) -> float:
-        """Calculate bearing from one point to another."""
+        """Calculate bearing from one point to another (degrees in and out). Accepts scalars or NumPy arrays."""
+        from_lat, from_lon, to_lat, to_lon = map(np.radians, [from_lat, from_lon, to_lat, to_lon])
         d_lon = to_lon - from_lon
-        y = math.sin(d_lon) * math.cos(to_lat)
-        x = math.cos(from_lat) * math.sin(to_lat) - math.sin(from_lat) * math.cos(to_lat) * math.cos(d_lon)
-        bearing = math.atan2(y, x)
-        return math.degrees(bearing) % 360
+        y = np.sin(d_lon) * np.cos(to_lat)
+        x = np.cos(from_lat) * np.sin(to_lat) - np.sin(from_lat) * np.cos(to_lat) * np.cos(d_lon)
+        bearing = np.arctan2(y, x)
+        return np.degrees(bearing) % 360
     
     def _calculate_flight_path_bearing(self, from_lat: float, from_lon: float, to_lat: float, to_lon: float) -> float:
         """Calculate bearing of flight path from departure to arrival."""
@@ -1,5 +1,7 @@
 import ephem
+import numpy as np
 from datetime import datetime, timezone
+from functools import lru_cache
 
 
 def subsolar_point(utc_dt: datetime) -> dict:
@@ -17,3 +19,45 @@ def subsolar_point(utc_dt: datetime) -> dict:
     # wrap to -180..180 then convert to -180..180 east-positive
     lon_deg = (lon_deg + 540) % 360 - 180
     return {"lat": lat_deg, "lon": lon_deg}
+
+
+def utc_minute(utc_dt: datetime) -> int:
+    """Return whole minutes since the Unix epoch; naive datetimes are taken as UTC."""
+    if utc_dt.tzinfo is None:
+        utc_dt = utc_dt.replace(tzinfo=timezone.utc)
+    return int(utc_dt.timestamp()) // 60
+
+
+@lru_cache(maxsize=200_000)
+def subsolar_point_cached(unix_minute: int) -> tuple[float, float]:
+    """Return (lat, lon) of sub-solar point for a UTC minute since the epoch, cached across requests."""
+    point = subsolar_point(datetime.fromtimestamp(unix_minute * 60, tz=timezone.utc))
+    return point["lat"], point["lon"]
+
+
+def subsolar_points(utc_dts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return (lat, lon) arrays of sub-solar points for an array of UTC datetime64.
+
+    Uses the closed-form NOAA/Meeus low-precision solar position (good to
+    ~0.01 deg) so a whole flight can be evaluated without per-minute ephem calls.
+    """
+    ts = np.asarray(utc_dts, dtype="datetime64[s]").astype(np.float64)
+    jd = 2440587.5 + ts / 86400.0
+    n = jd - 2451545.0
+    # mean longitude and mean anomaly of the sun (deg)
+    L = (280.460 + 0.9856474 * n) % 360
+    g = np.radians((357.528 + 0.9856003 * n) % 360)
+    # ecliptic longitude and obliquity of the ecliptic
+    lam = np.radians(L + 1.915 * np.sin(g) + 0.020 * np.sin(2 * g))
+    eps = np.radians(23.439 - 0.0000004 * n)
+    # latitude is declination directly
+    lat_deg = np.degrees(np.arcsin(np.sin(eps) * np.sin(lam)))
+    # equation of time (minutes) from mean longitude minus right ascension
+    ra_deg = np.degrees(np.arctan2(np.cos(eps) * np.sin(lam), np.cos(lam)))
+    eot_min = 4.0 * ((L - ra_deg + 540) % 360 - 180)
+    utc_hours = (ts % 86400.0) / 3600.0
+    lon_deg = -15.0 * (utc_hours - 12.0 + eot_min / 60.0)
+    # wrap to -180..180 east-positive
+    lon_deg = (lon_deg + 540) % 360 - 180
+    return lat_deg, lon_deg
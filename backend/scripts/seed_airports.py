@@ -16,6 +16,7 @@ engine = importlib.import_module("backend.app.db").engine
 Airport = importlib.import_module("backend.app.models").Airport
 
 CSV_PATH = pathlib.Path(__file__).parent.parent / "data" / "airports.csv"
+BATCH_SIZE = 1000
 
 
 def main():
@@ -23,23 +24,26 @@ def main():
         print("airports.csv not found in data/")
         return
 
-    with Session(engine) as session, open(CSV_PATH, newline="", encoding="utf-8") as f:
-        reader = csv.reader(f)
-        for row in reader:
-            # OpenFlights: ID,Name,City,Country,IATA,ICAO,Lat,Lon,Alt,TZ,DST,TzDB
-            iata = row[4]
-            if iata and iata != "\\N":
-                session.add(
-                    Airport(
-                        iata=iata.upper(),
-                        name=row[1],
-                        city=row[2],
-                        country=row[3],
-                        lat=float(row[6]),
-                        lon=float(row[7]),
-                        tz=row[11],
-                    )
-                )
+    with open(CSV_PATH, newline="", encoding="utf-8") as f:
+        # OpenFlights: ID,Name,City,Country,IATA,ICAO,Lat,Lon,Alt,TZ,DST,TzDB
+        rows = [
+            {
+                "iata": row[4].upper(),
+                "name": row[1],
+                "city": row[2],
+                "country": row[3],
+                "lat": float(row[6]),
+                "lon": float(row[7]),
+                "tz": row[11],
+            }
+            for row in csv.reader(f)
+            if row[4] and row[4] != "\\N"
+        ]
+
+    # executemany in batches instead of one ORM flush per airport
+    with Session(engine) as session:
+        for i in range(0, len(rows), BATCH_SIZE):
+            session.bulk_insert_mappings(Airport, rows[i:i + BATCH_SIZE])
         session.commit()
     print("Seed complete.")
 